@@ -3,6 +3,7 @@ Quake-Grade: Intelligent Seismic Severity Classification System
 Main application entry point using modular architecture.
 """
 
+import pandas as pd
 import streamlit as st
 
 from src.ui.components.data_loader import (
@@ -13,6 +14,7 @@ from src.ui.components.data_loader import (
 )
 from src.ui.components.llm_insights import display_prediction_insights
 from src.ui.components.predictions import (
+    count_severities,
     display_prediction_results,
     display_severity_distribution,
     run_prediction_pipeline,
@@ -42,6 +44,57 @@ from src.ui.utils.helpers import (
 )
 
 
+@st.fragment
+def display_descriptive_tab(df: pd.DataFrame):
+    """Display the descriptive analysis tab, rerunning it in isolation."""
+    # Statistics section
+    display_statistics(df)
+
+    st.divider()
+
+    # Distribution analysis
+    display_distribution_analysis(df)
+
+    st.divider()
+
+    # Correlation analysis
+    display_correlation_heatmap(df)
+
+
+@st.fragment
+def display_predictive_tab(df: pd.DataFrame):
+    """Display the predictive analysis tab, rerunning it in isolation."""
+    # Run prediction pipeline
+    success, predictions, error = run_prediction_pipeline(df)
+
+    if success and predictions is not None:
+        # Count severities once for the metrics and the distribution chart
+        severity_counts = count_severities(predictions)
+
+        # Display results
+        display_prediction_results(predictions, severity_counts)
+
+        st.divider()
+
+        # Severity distribution
+        display_severity_distribution(predictions, severity_counts)
+
+        st.divider()
+
+        # Map visualization
+        display_severity_map(predictions)
+
+    elif error:
+        st.error(ERROR_MODEL_LOAD.format(error))
+
+
+@st.fragment
+def display_ai_analysis_tab():
+    """Display the AI analysis tab, rerunning it in isolation."""
+    # LLM-powered insights on user's dataset
+    display_prediction_insights()
+
+
 def main():
     """Main application function."""
     # Initial setup
@@ -84,47 +137,18 @@ def main():
             [TAB_DESCRIPTIVE, TAB_PREDICTIVE, TAB_AI_ANALYSIS]
         )
 
+        # Each tab is a fragment, so its widgets only rerun that tab
         # Descriptive Analysis Tab
         with tab_descriptive:
-            # Statistics section
-            display_statistics(df)
-
-            st.divider()
-
-            # Distribution analysis
-            display_distribution_analysis(df)
-
-            st.divider()
-
-            # Correlation analysis
-            display_correlation_heatmap(df)
+            display_descriptive_tab(df)
 
         # Predictive Analysis Tab
         with tab_predictive:
-            # Run prediction pipeline
-            success, predictions, error = run_prediction_pipeline(df)
-
-            if success and predictions is not None:
-                # Display results
-                display_prediction_results(predictions)
-
-                st.divider()
-
-                # Severity distribution
-                display_severity_distribution(predictions)
-
-                st.divider()
-
-                # Map visualization
-                display_severity_map(predictions)
-
-            elif error:
-                st.error(ERROR_MODEL_LOAD.format(error))
+            display_predictive_tab(df)
 
         # AI Analysis Tab
         with tab_ai_analysis:
-            # LLM-powered insights on user's dataset
-            display_prediction_insights()
+            display_ai_analysis_tab()
 
     else:
         # No data loaded
@@ -5,6 +5,19 @@ Contains all prompt templates used by the LLM service.
 
 import json
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, installed transitively with PyCaret
+    orjson = None
+
+
+def _format_data(data: dict) -> str:
+    """Serialize summary data as indented JSON for prompt embedding."""
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, option=options).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
 
 def create_insights_prompt(data_summary: dict) -> str:
     """Create prompt for insights generation."""
@@ -12,7 +25,7 @@ def create_insights_prompt(data_summary: dict) -> str:
     Analise os seguintes dados de predições sísmicas e forneça insights acionáveis:
 
     Dados:
-    {json.dumps(data_summary, indent=2, ensure_ascii=False)}
+    {_format_data(data_summary)}
 
     Por favor, forneça:
     1. **Principais descobertas**: Padrões importantes nos dados de magnitude,
@@ -34,7 +47,7 @@ def create_risk_prompt(risk_summary: dict) -> str:
     Com base nos dados de predição sísmica, crie uma avaliação de risco:
 
     Dados de Risco:
-    {json.dumps(risk_summary, indent=2, ensure_ascii=False)}
+    {_format_data(risk_summary)}
 
     Por favor, forneça:
     1. **Nível de Risco Geral**: Baixo/Médio/Alto com justificativa baseada na
@@ -53,7 +66,7 @@ def create_quality_prompt(quality_summary: dict) -> str:
     Analise a qualidade dos dados sísmicos e sugira melhorias:
 
     Informações de Qualidade:
-    {json.dumps(quality_summary, indent=2, ensure_ascii=False)}
+    {_format_data(quality_summary)}
 
     Por favor, identifique:
     1. **Problemas de Qualidade**: Dados faltantes, duplicados, inconsistências
@@ -65,6 +78,36 @@ def create_quality_prompt(quality_summary: dict) -> str:
     """
 
 
+def create_combined_prompt(
+    data_summary: dict, risk_summary: dict, quality_summary: dict
+) -> str:
+    """Create prompt for generating all analyses in a single request."""
+    # Invariant instructions come first so the prompt prefix can be cached
+    return f"""
+    Gere três análises dos dados de predições sísmicas e responda em JSON com
+    as chaves "insights", "risk" e "quality", cada uma contendo texto em
+    Markdown:
+
+    - **insights**: Principais descobertas, distribuição de severidade,
+      características geográficas e recomendações para gestores de emergência
+    - **risk**: Nível de risco geral, eventos críticos (Muy Alta), medidas
+      preventivas e monitoramento para autoridades de proteção civil
+    - **quality**: Problemas de qualidade, impacto na análise, recomendações de
+      melhoria e prioridades, de forma específica e técnica
+
+    Mantenha cada análise concisa e focada em insights práticos.
+
+    Dados:
+    {_format_data(data_summary)}
+
+    Dados de Risco:
+    {_format_data(risk_summary)}
+
+    Informações de Qualidade:
+    {_format_data(quality_summary)}
+    """
+
+
 # System prompts for different analysis types
 INSIGHTS_SYSTEM_PROMPT = (
     "Você é um especialista em análise sísmica que gera insights claros e "
@@ -80,3 +123,8 @@ QUALITY_SYSTEM_PROMPT = (
     "Você é um especialista em qualidade de dados sísmicos que identifica "
     "problemas e sugere melhorias."
 )
+
+COMBINED_SYSTEM_PROMPT = (
+    "Você é um especialista em análise sísmica, gestão de riscos e qualidade de "
+    "dados que responde sempre com um objeto JSON válido."
+)
@@ -4,20 +4,34 @@ Integrates with OpenAI API for generating insights, risk assessments, and data q
 analysis.
 """
 
+import json
+from functools import lru_cache
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from openai import OpenAI
 
 from .llm_prompts import (
+    COMBINED_SYSTEM_PROMPT,
     INSIGHTS_SYSTEM_PROMPT,
     QUALITY_SYSTEM_PROMPT,
     RISK_SYSTEM_PROMPT,
+    create_combined_prompt,
     create_insights_prompt,
     create_quality_prompt,
     create_risk_prompt,
 )
 
+# Row count above which duplicate detection is skipped in quality summaries
+DUPLICATE_CHECK_MAX_ROWS = 200_000
+
+
+@lru_cache(maxsize=4)
+def _get_client(api_key: str) -> OpenAI:
+    """Get a shared OpenAI client so connections are reused across calls."""
+    return OpenAI(api_key=api_key, timeout=60.0, max_retries=2)
+
 
 class LLMService:
     """Service for LLM-powered earthquake data analysis."""
@@ -32,7 +46,7 @@ class LLMService:
     def _initialize_client(self, api_key: str) -> None:
         """Initialize OpenAI client with API key."""
         try:
-            self._client = OpenAI(api_key=api_key)
+            self._client = _get_client(api_key)
         except Exception as e:
             self._error_message = f"Erro ao inicializar serviço de IA: {str(e)}"
 
@@ -51,7 +65,7 @@ class LLMService:
         if not self.is_available():
             return None
 
-        data_summary = self._prepare_data_summary(predictions_df)
+        data_summary = _prepare_data_summary(predictions_df)
         prompt = create_insights_prompt(data_summary)
 
         return self._call_openai_api(
@@ -67,7 +81,7 @@ class LLMService:
         if not self.is_available():
             return None
 
-        risk_summary = self._prepare_risk_summary(predictions_df)
+        risk_summary = _prepare_risk_summary(predictions_df)
         prompt = create_risk_prompt(risk_summary)
 
         return self._call_openai_api(
@@ -83,7 +97,7 @@ class LLMService:
         if not self.is_available():
             return None
 
-        quality_summary = self._prepare_quality_summary(df)
+        quality_summary = _prepare_quality_summary(df)
         prompt = create_quality_prompt(quality_summary)
 
         return self._call_openai_api(
@@ -94,6 +108,35 @@ class LLMService:
             error_message="Erro ao analisar qualidade dos dados",
         )
 
+    def generate_all_analyses(self, predictions_df: pd.DataFrame) -> Optional[dict]:
+        """Generate insights, risk assessment and data quality in one request."""
+        if not self.is_available():
+            return None
+
+        prompt = create_combined_prompt(
+            _prepare_data_summary(predictions_df),
+            _prepare_risk_summary(predictions_df),
+            _prepare_quality_summary(predictions_df),
+        )
+
+        response = self._call_openai_api(
+            system_prompt=COMBINED_SYSTEM_PROMPT,
+            user_prompt=prompt,
+            max_tokens=2400,
+            temperature=0.3,
+            error_message="Erro ao gerar análises",
+            response_format={"type": "json_object"},
+        )
+        if response is None:
+            return None
+
+        try:
+            analyses = json.loads(response)
+            return {key: str(analyses[key]) for key in ("insights", "risk", "quality")}
+        except (ValueError, KeyError, TypeError) as e:
+            self._error_message = f"Erro ao interpretar análises: {str(e)}"
+            return None
+
     def _call_openai_api(
         self,
         system_prompt: str,
@@ -101,8 +144,10 @@ class LLMService:
         max_tokens: int,
         temperature: float,
         error_message: str,
+        response_format: Optional[dict] = None,
     ) -> Optional[str]:
         """Make API call to OpenAI with error handling."""
+        options = {"response_format": response_format} if response_format else {}
         try:
             response = self._client.chat.completions.create(
                 model="gpt-4o-mini",
@@ -112,106 +157,157 @@ class LLMService:
                 ],
                 max_tokens=max_tokens,
                 temperature=temperature,
+                **options,
             )
             return response.choices[0].message.content
         except Exception as e:
             self._error_message = f"{error_message}: {str(e)}"
             return None
 
-    def _prepare_data_summary(self, df: pd.DataFrame) -> dict:
-        """Prepare data summary for LLM analysis using only available columns."""
-        try:
-            summary = {
-                "total_events": int(len(df)),
-                "magnitude_stats": {},
-                "depth_stats": {},
-                "latitude_range": {},
-                "longitude_range": {},
-                "severity_distribution": {},
-            }
 
-            if "Magnitud" in df.columns:
-                summary["magnitude_stats"] = self._get_numeric_stats(df["Magnitud"])
+def _prepare_data_summary(df: pd.DataFrame) -> dict:
+    """Prepare data summary for LLM analysis using only available columns."""
+    try:
+        summary = {
+            "total_events": int(len(df)),
+            "magnitude_stats": {},
+            "depth_stats": {},
+            "latitude_range": {},
+            "longitude_range": {},
+            "severity_distribution": {},
+        }
+
+        # Aggregate all numeric columns in a single pass
+        stats_columns = [
+            col
+            for col in ("Magnitud", "Profundidad", "Latitud", "Longitud")
+            if col in df.columns
+        ]
+        stats = (
+            _aggregate_columns(df, stats_columns)
+            if stats_columns and len(df) > 0
+            else pd.DataFrame()
+        )
+
+        if "Magnitud" in stats.columns:
+            summary["magnitude_stats"] = _get_numeric_stats(stats["Magnitud"])
 
-            if "Profundidad" in df.columns:
-                summary["depth_stats"] = self._get_numeric_stats(df["Profundidad"])
+        if "Profundidad" in stats.columns:
+            summary["depth_stats"] = _get_numeric_stats(stats["Profundidad"])
 
-            if "Latitud" in df.columns:
-                summary["latitude_range"] = self._get_range_stats(df["Latitud"])
+        if "Latitud" in stats.columns:
+            summary["latitude_range"] = _get_range_stats(stats["Latitud"])
 
-            if "Longitud" in df.columns:
-                summary["longitude_range"] = self._get_range_stats(df["Longitud"])
+        if "Longitud" in stats.columns:
+            summary["longitude_range"] = _get_range_stats(stats["Longitud"])
+
+        if "Gravedad" in df.columns:
+            severity_counts = df["Gravedad"].value_counts()
+            summary["severity_distribution"] = {
+                k: int(v) for k, v in severity_counts.to_dict().items()
+            }
+
+        return summary
+    except Exception:
+        return {"total_events": int(len(df)), "error": "Erro ao processar dados"}
+
+
+def _aggregate_columns(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """Get min, max, mean and std of numeric columns in one NumPy sweep."""
+    values = df[columns].to_numpy(dtype=np.float64)
+
+    # NaN-aware reductions are only needed when values are missing
+    if np.isnan(values).any():
+        stats = [
+            np.nanmin(values, axis=0),
+            np.nanmax(values, axis=0),
+            np.nanmean(values, axis=0),
+            np.nanstd(values, axis=0, ddof=1),
+        ]
+    else:
+        stats = [
+            values.min(axis=0),
+            values.max(axis=0),
+            values.mean(axis=0),
+            values.std(axis=0, ddof=1),
+        ]
+
+    return pd.DataFrame(
+        np.stack(stats), index=["min", "max", "mean", "std"], columns=columns
+    )
+
+
+def _get_numeric_stats(stats: pd.Series) -> dict:
+    """Get numeric statistics from a column of aggregated stats."""
+    return {
+        "min": float(stats["min"]),
+        "max": float(stats["max"]),
+        "mean": float(stats["mean"]),
+        "std": float(stats["std"]),
+    }
+
+
+def _get_range_stats(stats: pd.Series) -> dict:
+    """Get range statistics from a column of aggregated stats."""
+    return {"min": float(stats["min"]), "max": float(stats["max"])}
+
+
+def _prepare_risk_summary(df: pd.DataFrame) -> dict:
+    """Prepare risk summary for assessment using only available columns."""
+    try:
+        summary = {
+            "total_events": int(len(df)),
+            "high_risk_count": 0,
+            "medium_risk_count": 0,
+            "low_risk_count": 0,
+            "avg_magnitude_high_risk": 0.0,
+        }
 
-            if "Gravedad" in df.columns:
-                severity_counts = df["Gravedad"].value_counts()
-                summary["severity_distribution"] = {
-                    k: int(v) for k, v in severity_counts.to_dict().items()
-                }
+        if "Gravedad" in df.columns:
+            high_risk = df[df["Gravedad"] == "Muy Alta"]
+            medium_risk = df[df["Gravedad"] == "Alta"]
+            low_risk = df[df["Gravedad"].isin(["Media", "Baja"])]
 
-            return summary
-        except Exception:
-            return {"total_events": int(len(df)), "error": "Erro ao processar dados"}
+            summary["high_risk_count"] = int(len(high_risk))
+            summary["medium_risk_count"] = int(len(medium_risk))
+            summary["low_risk_count"] = int(len(low_risk))
 
-    def _get_numeric_stats(self, series: pd.Series) -> dict:
-        """Get numeric statistics for a pandas series."""
+            if len(high_risk) > 0 and "Magnitud" in high_risk.columns:
+                summary["avg_magnitude_high_risk"] = float(high_risk["Magnitud"].mean())
+
+        return summary
+    except Exception:
         return {
-            "min": float(series.min()),
-            "max": float(series.max()),
-            "mean": float(series.mean()),
-            "std": float(series.std()),
+            "total_events": int(len(df)),
+            "error": "Erro ao processar dados de risco",
         }
 
-    def _get_range_stats(self, series: pd.Series) -> dict:
-        """Get range statistics for a pandas series."""
-        return {"min": float(series.min()), "max": float(series.max())}
 
-    def _prepare_risk_summary(self, df: pd.DataFrame) -> dict:
-        """Prepare risk summary for assessment using only available columns."""
-        try:
-            summary = {
-                "total_events": int(len(df)),
-                "high_risk_count": 0,
-                "medium_risk_count": 0,
-                "low_risk_count": 0,
-                "avg_magnitude_high_risk": 0.0,
-            }
+def _prepare_quality_summary(df: pd.DataFrame) -> dict:
+    """Prepare data quality summary."""
+    try:
+        columns = list(df.columns)
+        missing_values = df.isna().sum(axis=0).to_numpy()
+        data_types = df.dtypes.astype(str).to_numpy()
 
-            if "Gravedad" in df.columns:
-                high_risk = df[df["Gravedad"] == "Muy Alta"]
-                medium_risk = df[df["Gravedad"] == "Alta"]
-                low_risk = df[df["Gravedad"].isin(["Media", "Baja"])]
-
-                summary["high_risk_count"] = int(len(high_risk))
-                summary["medium_risk_count"] = int(len(medium_risk))
-                summary["low_risk_count"] = int(len(low_risk))
-
-                if len(high_risk) > 0 and "Magnitud" in high_risk.columns:
-                    summary["avg_magnitude_high_risk"] = float(
-                        high_risk["Magnitud"].mean()
-                    )
-
-            return summary
-        except Exception:
-            return {
-                "total_events": int(len(df)),
-                "error": "Erro ao processar dados de risco",
-            }
+        # Duplicate detection hashes every row, so skip it for very large frames
+        duplicate_rows = (
+            int(df.duplicated().sum()) if len(df) < DUPLICATE_CHECK_MAX_ROWS else None
+        )
 
-    def _prepare_quality_summary(self, df: pd.DataFrame) -> dict:
-        """Prepare data quality summary."""
-        try:
-            summary = {
-                "total_rows": int(len(df)),
-                "columns": list(df.columns),
-                "missing_values": {
-                    k: int(v) for k, v in df.isnull().sum().to_dict().items()
-                },
-                "duplicate_rows": int(df.duplicated().sum()),
-                "data_types": df.dtypes.astype(str).to_dict(),
-            }
-            return summary
-        except Exception:
-            return {"total_rows": int(len(df)), "error": "Erro ao analisar qualidade"}
+        summary = {
+            "total_rows": int(len(df)),
+            "columns": columns,
+            "missing_values": {
+                col: int(count)
+                for col, count in zip(columns, missing_values, strict=True)
+            },
+            "duplicate_rows": duplicate_rows,
+            "data_types": dict(zip(columns, data_types, strict=True)),
+        }
+        return summary
+    except Exception:
+        return {"total_rows": int(len(df)), "error": "Erro ao analisar qualidade"}
 
 
 # Factory function to create LLM service instance
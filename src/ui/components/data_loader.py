@@ -11,10 +11,13 @@ from ..utils.constants import (
     CACHE_TTL_DATA,
     ERROR_FILE_LOAD,
     ERROR_MISSING_COLUMNS,
+    EXPECTED_COLUMNS,
+    EXPECTED_DTYPES,
     METRIC_MEMORY_USAGE,
     METRIC_TOTAL_COLUMNS,
     METRIC_TOTAL_RECORDS,
     SUCCESS_FILE_LOADED,
+    UPLOAD_CHUNK_SIZE,
     UPLOAD_LABEL,
 )
 from ..utils.validators import (
@@ -24,6 +27,9 @@ from ..utils.validators import (
     validate_data_types,
 )
 
+# Shared PCG64 generator for random dataset generation
+_rng = np.random.default_rng()
+
 
 @st.cache_data(ttl=CACHE_TTL_DATA)
 def load_base_dataset() -> pd.DataFrame:
@@ -33,11 +39,74 @@ def load_base_dataset() -> pd.DataFrame:
     Returns:
         Base DataFrame for the application
     """
-    df = pd.read_csv(BASE_DATASET_PATH)
+    # Parse only the expected columns with known dtypes to skip type inference
+    df = pd.read_csv(
+        BASE_DATASET_PATH,
+        engine="pyarrow",
+        usecols=EXPECTED_COLUMNS,
+        dtype=EXPECTED_DTYPES,
+    )
     df = clean_dataset(df)
     return df
 
 
+@st.cache_data(ttl=CACHE_TTL_DATA)
+def _compute_numeric_stats(base_df: pd.DataFrame) -> dict:
+    """
+    Compute and cache the statistical properties of the numeric columns.
+
+    Args:
+        base_df: Base DataFrame to compute statistics for
+
+    Returns:
+        Dictionary with numeric column names, means, stds, mins, maxs and
+        integer column mask
+    """
+    numeric_cols = [
+        col for col in base_df.columns if pd.api.types.is_numeric_dtype(base_df[col])
+    ]
+    # Reduce a single column-major block so every column is read with unit stride
+    values = np.asfortranarray(base_df[numeric_cols].to_numpy(dtype=np.float64))
+
+    return {
+        "columns": numeric_cols,
+        "means": np.nanmean(values, axis=0),
+        "stds": np.nanstd(values, axis=0, ddof=1),
+        "mins": np.nanmin(values, axis=0),
+        "maxs": np.nanmax(values, axis=0),
+        "is_int": np.array(
+            [pd.api.types.is_integer_dtype(base_df[col]) for col in numeric_cols],
+            dtype=bool,
+        ),
+    }
+
+
+@st.cache_data(ttl=CACHE_TTL_DATA)
+def _compute_categorical_distributions(
+    base_df: pd.DataFrame, columns: list[str]
+) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """
+    Compute and cache the value distribution of categorical columns.
+
+    Args:
+        base_df: Base DataFrame to compute distributions for
+        columns: Categorical column names
+
+    Returns:
+        Dictionary mapping each column to its (categories, cumulative
+        probabilities) arrays
+    """
+    distributions = {}
+
+    for col in columns:
+        probabilities = base_df[col].value_counts(normalize=True)
+        cumulative = np.cumsum(probabilities.to_numpy())
+        cumulative /= cumulative[-1]
+        distributions[col] = (probabilities.index.to_numpy(), cumulative)
+
+    return distributions
+
+
 def generate_random_dataset(
     base_df: pd.DataFrame, n_samples: Optional[int] = None
 ) -> pd.DataFrame:
@@ -54,33 +123,49 @@ def generate_random_dataset(
     if n_samples is None:
         n_samples = len(base_df)
 
-    random_df = pd.DataFrame()
+    # Reuse the cached statistical properties of the numeric columns
+    stats = _compute_numeric_stats(base_df)
+    numeric_cols = stats["columns"]
+    columns = {}
 
-    for col in base_df.columns:
-        if pd.api.types.is_numeric_dtype(base_df[col]):
-            # Generate random numeric data preserving statistical properties
-            mean = base_df[col].mean()
-            std = base_df[col].std()
-            min_val = base_df[col].min()
-            max_val = base_df[col].max()
+    if numeric_cols:
+        # Generate normal distribution for every column and clip to original range,
+        # scaling in place so no extra (n_samples, n_cols) temporaries are made
+        values = _rng.standard_normal((n_samples, len(numeric_cols)))
+        values *= stats["stds"]
+        values += stats["means"]
+        np.clip(values, stats["mins"], stats["maxs"], out=values)
 
-            # Generate normal distribution and clip to original range
-            values = np.random.normal(loc=mean, scale=std, size=n_samples)
-            values = np.clip(values, min_val, max_val)
+        # Preserve integer type if original was integer
+        is_int = stats["is_int"]
+        int_values = np.rint(values[:, is_int]).astype(np.int64)
+        int_cols = [col for col, flag in zip(numeric_cols, is_int, strict=True) if flag]
+        float_cols = [col for col in numeric_cols if col not in int_cols]
 
-            # Preserve integer type if original was integer
-            if pd.api.types.is_integer_dtype(base_df[col]):
-                values = np.round(values).astype(int)
+        # Store float columns in the base dtype (float32 after loading)
+        float_dtype = np.result_type(np.float32, *base_df[float_cols].dtypes)
+        float_values = values[:, ~is_int].astype(float_dtype, copy=False)
 
-            random_df[col] = values
-        else:
-            # For categorical columns, sample from existing values
-            probabilities = base_df[col].value_counts(normalize=True)
-            categories = probabilities.index.tolist()
-            probs = probabilities.values
-            random_df[col] = np.random.choice(categories, size=n_samples, p=probs)
+        columns.update(zip(int_cols, int_values.T, strict=True))
+        columns.update(zip(float_cols, float_values.T, strict=True))
 
-    return random_df
+    categorical_cols = [col for col in base_df.columns if col not in columns]
+
+    if categorical_cols:
+        distributions = _compute_categorical_distributions(base_df, categorical_cols)
+
+        # Draw uniform samples for all categorical columns at once
+        uniforms = _rng.random((n_samples, len(categorical_cols)))
+
+        for col, col_uniforms in zip(categorical_cols, uniforms.T, strict=True):
+            # Sample from existing values through their cumulative distribution
+            categories, cumulative = distributions[col]
+            indices = np.searchsorted(cumulative, col_uniforms, side="right")
+            columns[col] = categories[indices]
+
+    # Build the output in a single constructor call, keeping the original order;
+    # the default copy consolidates the columns into one block per dtype
+    return pd.DataFrame({col: columns[col] for col in base_df.columns})
 
 
 def handle_file_upload() -> Optional[pd.DataFrame]:
@@ -94,17 +179,31 @@ def handle_file_upload() -> Optional[pd.DataFrame]:
 
     if uploaded_file is not None:
         try:
-            # Read the CSV file
-            df = pd.read_csv(uploaded_file)
-
-            # Clean the dataset
-            df = clean_dataset(df)
-
-            # Validate columns
-            columns_valid, missing_columns = validate_columns(df)
-            if not columns_valid:
-                st.error(ERROR_MISSING_COLUMNS.format(", ".join(missing_columns)))
-                return None
+            # Read the CSV file in chunks to bound peak memory
+            progress_bar = st.progress(0.0)
+            chunks = []
+
+            for chunk in pd.read_csv(uploaded_file, chunksize=UPLOAD_CHUNK_SIZE):
+                # Clean the chunk and shrink numeric columns to save memory
+                chunk = clean_dataset(chunk)
+
+                # Validate columns on the first chunk to abort early
+                if not chunks:
+                    columns_valid, missing_columns = validate_columns(chunk)
+                    if not columns_valid:
+                        progress_bar.empty()
+                        st.error(
+                            ERROR_MISSING_COLUMNS.format(", ".join(missing_columns))
+                        )
+                        return None
+
+                chunks.append(chunk)
+                progress_bar.progress(
+                    min(uploaded_file.tell() / max(uploaded_file.size, 1), 1.0)
+                )
+
+            progress_bar.empty()
+            df = pd.concat(chunks, ignore_index=True)
 
             # Validate data types
             types_valid, type_errors = validate_data_types(df)
@@ -145,4 +244,6 @@ def display_data_info(df: pd.DataFrame):
         st.metric(METRIC_TOTAL_COLUMNS, len(df.columns))
 
     with col3:
-        st.metric(METRIC_MEMORY_USAGE, f"{df.memory_usage().sum() / 1024:.1f} KB")
+        # Shallow, index-free sum is O(columns); it never walks object cells
+        memory_kb = df.memory_usage(deep=False, index=False).sum() / 1024
+        st.metric(METRIC_MEMORY_USAGE, f"{memory_kb:.1f} KB")
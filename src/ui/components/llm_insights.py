@@ -1,13 +1,14 @@
 """LLM-powered insights component for earthquake data analysis."""
 
-import hashlib
 from typing import Optional
 
-import pandas as pd
 import streamlit as st
 
 from src.services.llm_service import create_llm_service
 from src.ui.utils.constants import (
+    AI_ALL_BUTTON,
+    AI_ALL_SPINNER,
+    AI_ALL_UNKNOWN_ERROR,
     AI_ANALYSIS_DESCRIPTION,
     AI_ANALYSIS_TITLE,
     AI_CLEAR_BUTTON,
@@ -31,6 +32,7 @@ from src.ui.utils.constants import (
     AI_UNAVAILABLE_WARNING,
     UPLOAD_FIRST_LABEL,
 )
+from src.ui.utils.helpers import generate_data_hash
 
 
 @st.cache_data(ttl=1800, max_entries=50)
@@ -78,11 +80,24 @@ def _cached_quality_analysis(data_hash: str, api_key: str) -> Optional[str]:
     return llm_service.analyze_data_quality(df)
 
 
-def _generate_data_hash(df: pd.DataFrame) -> str:
-    """Generate a hash of the user's dataset for caching purposes."""
-    # Create a hash based on the dataframe content to enable caching
-    df_string = df.to_string()
-    return hashlib.md5(df_string.encode()).hexdigest()
+@st.cache_data(ttl=1800, max_entries=50)
+def _cached_all_analyses(data_hash: str, api_key: str) -> Optional[dict]:
+    """Generate all analyses from user's dataset in one request (30-minute TTL)."""
+    # Get the user's uploaded dataset from session state
+    df = st.session_state.get("df")
+    if df is None:
+        return None
+
+    llm_service = create_llm_service(api_key)
+    if not llm_service.is_available():
+        return None
+
+    analyses = llm_service.generate_all_analyses(df)
+    if analyses is None:
+        # Raise instead of returning None: exceptions are not cached, so the
+        # next click retries, and the caller shows this instance's error
+        raise RuntimeError(llm_service.get_error_message() or AI_ALL_UNKNOWN_ERROR)
+    return analyses
 
 
 def _initialize_llm_session_state():
@@ -136,7 +151,24 @@ def display_prediction_insights():
     st.write(AI_ANALYSIS_DESCRIPTION)
 
     # Generate data hash for caching LLM responses
-    data_hash = _generate_data_hash(df)
+    data_hash = generate_data_hash(df)
+
+    # Generate all analyses with a single LLM request
+    if st.button(AI_ALL_BUTTON, use_container_width=True):
+        with st.spinner(AI_ALL_SPINNER):
+            try:
+                analyses = _cached_all_analyses(data_hash, api_key)
+                if analyses:
+                    st.session_state.llm_insights = analyses["insights"]
+                    st.session_state.llm_risk_assessment = analyses["risk"]
+                    st.session_state.llm_quality_analysis = analyses["quality"]
+                    st.session_state.llm_errors = {}
+                else:
+                    for key in ("insights", "risk", "quality"):
+                        st.session_state.llm_errors[key] = AI_ALL_UNKNOWN_ERROR
+            except Exception as e:
+                for key in ("insights", "risk", "quality"):
+                    st.session_state.llm_errors[key] = AI_GENERIC_ERROR.format(str(e))
 
     # Create columns for buttons and results
     col1, col2, col3 = st.columns(3)
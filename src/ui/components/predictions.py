@@ -1,12 +1,17 @@
 """Machine learning prediction components for the Quake-Grade application."""
 
+import io
+from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import streamlit as st
-from pycaret.classification import load_model, predict_model
 
 from ..utils.constants import (
+    CACHE_MAX_ENTRIES,
+    CACHE_TTL_DATA,
+    COLUMN_SEVERITY_LABEL,
     DOWNLOAD_FILENAME,
     DOWNLOAD_LABEL,
     HEADER_PREDICTION_DETAILS,
@@ -15,6 +20,7 @@ from ..utils.constants import (
     HELP_HIGH_SEVERITY,
     HELP_LOW_SEVERITY,
     HELP_MEDIUM_SEVERITY,
+    HELP_SEVERITY_COLUMN,
     HELP_VERY_HIGH_SEVERITY,
     LOADING_MODEL,
     LOADING_PREDICTIONS,
@@ -23,10 +29,24 @@ from ..utils.constants import (
     METRIC_MEDIUM_SEVERITY,
     METRIC_VERY_HIGH_SEVERITY,
     MODEL_PATH,
+    PREDICTION_BATCH_SIZE,
+    PREDICTIONS_STYLE_MAX_ROWS,
+    PREDICTIONS_TABLE_HEIGHT,
     SEVERITY_COLORS,
     SEVERITY_LEVELS,
     SUCCESS_MODEL_LOADED,
 )
+from ..utils.helpers import generate_data_hash
+
+# Row CSS per severity category code; the trailing entry (code -1) is the
+# fallback for missing or unknown severities
+_SEVERITY_ROW_STYLES = np.array(
+    [
+        *(f"background-color: {SEVERITY_COLORS[level]}" for level in SEVERITY_LEVELS),
+        "background-color: #ffffff",
+    ],
+    dtype=object,
+)
 
 
 @st.cache_resource
@@ -38,6 +58,9 @@ def load_ml_model():
     Returns:
         Loaded PyCaret model
     """
+    # Imported lazily so PyCaret only loads when predictions are requested
+    from pycaret.classification import load_model
+
     try:
         model = load_model(MODEL_PATH)
         return model, None
@@ -45,9 +68,34 @@ def load_ml_model():
         return None, str(e)
 
 
+def get_model_version() -> str:
+    """
+    Identify the current model file so cached predictions follow model updates.
+
+    Returns:
+        Version string built from the model file size and modification time
+    """
+    model_stat = Path(f"{MODEL_PATH}.pkl").stat()
+    return f"{model_stat.st_size}-{model_stat.st_mtime_ns}"
+
+
+def _hash_dataframe(df: pd.DataFrame) -> bytes:
+    """
+    Hash a DataFrame by content so it can be used as a cache key.
+
+    Args:
+        df: DataFrame to hash
+
+    Returns:
+        Bytes digest of the DataFrame columns and values
+    """
+    values_hash = pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes()
+    return str(tuple(df.columns)).encode() + values_hash
+
+
 def run_predictions(model, df: pd.DataFrame) -> pd.DataFrame:
     """
-    Run predictions on the input DataFrame.
+    Run predictions on the input DataFrame, reusing cached results.
 
     Args:
         model: Loaded ML model
@@ -56,12 +104,87 @@ def run_predictions(model, df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with predictions
     """
-    predictions = predict_model(model, data=df)
+    return _cached_run_predictions(
+        generate_data_hash(df), get_model_version(), model, df
+    )
+
+
+@st.cache_data(persist="disk", max_entries=CACHE_MAX_ENTRIES)
+def _cached_run_predictions(
+    data_hash: str, model_version: str, _model, _df: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Run and cache predictions keyed on the precomputed data hash.
+    The cache is persisted to disk, so unchanged DataFrames skip inference
+    across reruns and app restarts; disk caches ignore TTL, so entries are
+    bounded by count instead.
+
+    Args:
+        data_hash: Content hash of the input DataFrame
+        model_version: Model file version, used to invalidate the cache
+        _model: Loaded ML model (excluded from the cache key)
+        _df: Input DataFrame (excluded from the cache key)
+
+    Returns:
+        DataFrame with predictions
+    """
+    from pycaret.classification import predict_model
+
+    # Score large inputs in fixed-size batches to bound peak preprocessing memory
+    if len(_df) > PREDICTION_BATCH_SIZE:
+        predictions = pd.concat(
+            [
+                predict_model(
+                    _model, data=_df.iloc[start : start + PREDICTION_BATCH_SIZE]
+                )
+                for start in range(0, len(_df), PREDICTION_BATCH_SIZE)
+            ]
+        )
+    else:
+        predictions = predict_model(_model, data=_df)
     # Rename prediction column to match expected name
     predictions = predictions.rename(columns={"prediction_label": "Gravedad"})
+    # Store severities as ordered categories so grouping works on integer codes
+    predictions["Gravedad"] = pd.Categorical(
+        predictions["Gravedad"], categories=list(SEVERITY_LEVELS), ordered=True
+    )
     return predictions
 
 
+@st.cache_data(
+    ttl=CACHE_TTL_DATA,
+    max_entries=CACHE_MAX_ENTRIES,
+    hash_funcs={pd.DataFrame: _hash_dataframe},
+)
+def _predictions_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Serialize and cache predictions as UTF-8 encoded CSV.
+
+    Args:
+        df: DataFrame with predictions
+
+    Returns:
+        CSV content as bytes
+    """
+    # Write UTF-8 bytes directly instead of building and re-encoding a str
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, encoding="utf-8")
+    return buffer.getvalue()
+
+
+def _severity_codes(severities: pd.Series) -> np.ndarray:
+    """
+    Map severity labels to their SEVERITY_LEVELS category codes.
+
+    Args:
+        severities: Severity labels, as strings or an ordered Categorical
+
+    Returns:
+        Integer codes array, with -1 for missing or unknown labels
+    """
+    return pd.Categorical(severities, categories=list(SEVERITY_LEVELS)).codes
+
+
 def style_predictions_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
     Apply color styling to predictions based on severity.
@@ -72,65 +195,103 @@ def style_predictions_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Styled DataFrame
     """
+    # Look up the row colors by severity category code, without string matching
+    if "Gravedad" in df.columns:
+        codes = _severity_codes(df["Gravedad"])
+    else:
+        codes = np.full(len(df), -1, dtype=np.int8)
+    row_styles = _SEVERITY_ROW_STYLES[codes]
+    cell_styles = np.broadcast_to(row_styles[:, None], df.shape)
+
+    def apply_severity_colors(data):
+        """Apply the precomputed severity colors to every cell at once."""
+        return pd.DataFrame(cell_styles, index=data.index, columns=data.columns)
+
+    # Apply styling to the whole frame in a single call
+    styled_df = df.style.apply(apply_severity_colors, axis=None)
+    return styled_df
 
-    def apply_row_color(row):
-        """Apply background color based on severity level."""
-        severity = row.get("Gravedad", "")
-        color = SEVERITY_COLORS.get(severity, "#ffffff")
-        return [f"background-color: {color}"] * len(row)
 
-    # Apply styling
-    styled_df = df.style.apply(apply_row_color, axis=1)
-    return styled_df
+def count_severities(predictions: pd.DataFrame) -> pd.Series:
+    """
+    Count predictions per severity level in a single pass.
 
+    Args:
+        predictions: DataFrame with predictions
 
-def display_prediction_results(predictions: pd.DataFrame):
+    Returns:
+        Series of counts indexed by every severity level, in severity order
+    """
+    # One bincount over the category codes; -1 marks missing or unknown labels
+    codes = _severity_codes(predictions["Gravedad"])
+    counts = np.bincount(codes[codes >= 0], minlength=len(SEVERITY_LEVELS))
+    return pd.Series(counts, index=list(SEVERITY_LEVELS), name="count")
+
+
+def display_prediction_results(
+    predictions: pd.DataFrame, severity_counts: Optional[pd.Series] = None
+):
     """
     Display prediction results with proper formatting.
 
     Args:
         predictions: DataFrame with predictions
+        severity_counts: Precomputed counts from count_severities (optional)
     """
     st.subheader(HEADER_PREDICTIONS)
 
     # Display metrics
     col1, col2, col3, col4 = st.columns(4)
 
-    severity_counts = predictions["Gravedad"].value_counts()
+    if severity_counts is None:
+        severity_counts = count_severities(predictions)
 
     with col1:
         st.metric(
-            METRIC_LOW_SEVERITY, severity_counts.get("Baja", 0), help=HELP_LOW_SEVERITY
+            METRIC_LOW_SEVERITY, int(severity_counts["Baja"]), help=HELP_LOW_SEVERITY
         )
 
     with col2:
         st.metric(
             METRIC_MEDIUM_SEVERITY,
-            severity_counts.get("Media", 0),
+            int(severity_counts["Media"]),
             help=HELP_MEDIUM_SEVERITY,
         )
 
     with col3:
         st.metric(
             METRIC_HIGH_SEVERITY,
-            severity_counts.get("Alta", 0),
+            int(severity_counts["Alta"]),
             help=HELP_HIGH_SEVERITY,
         )
 
     with col4:
         st.metric(
             METRIC_VERY_HIGH_SEVERITY,
-            severity_counts.get("Muy Alta", 0),
+            int(severity_counts["Muy Alta"]),
             help=HELP_VERY_HIGH_SEVERITY,
         )
 
     # Display styled dataframe
     st.write(HEADER_PREDICTION_DETAILS)
-    styled_df = style_predictions_dataframe(predictions)
-    st.dataframe(styled_df, use_container_width=True)
+    if len(predictions) <= PREDICTIONS_STYLE_MAX_ROWS:
+        styled_df = style_predictions_dataframe(predictions)
+        st.dataframe(styled_df, use_container_width=True)
+    else:
+        # Large frames skip per-cell styling and rely on the virtualized grid
+        st.dataframe(
+            predictions,
+            use_container_width=True,
+            height=PREDICTIONS_TABLE_HEIGHT,
+            column_config={
+                "Gravedad": st.column_config.TextColumn(
+                    COLUMN_SEVERITY_LABEL, help=HELP_SEVERITY_COLUMN
+                )
+            },
+        )
 
     # Download button
-    csv_data = predictions.to_csv(index=False).encode("utf-8")
+    csv_data = _predictions_to_csv_bytes(predictions)
     st.download_button(
         label=DOWNLOAD_LABEL,
         data=csv_data,
@@ -169,22 +330,28 @@ def run_prediction_pipeline(
             return False, None, str(e)
 
 
-def display_severity_distribution(predictions: pd.DataFrame):
+def display_severity_distribution(
+    predictions: pd.DataFrame, severity_counts: Optional[pd.Series] = None
+):
     """
     Display distribution of predicted severities.
 
     Args:
         predictions: DataFrame with predictions
+        severity_counts: Precomputed counts from count_severities (optional)
     """
     st.subheader(HEADER_SEVERITY_DISTRIBUTION)
-    severity_counts = predictions["Gravedad"].value_counts()
+    if severity_counts is None:
+        severity_counts = count_severities(predictions)
 
     # Create a bar chart using Streamlit native chart
-    chart_data = pd.DataFrame(
-        {
-            "Gravidade": [SEVERITY_LEVELS.get(k, k) for k in severity_counts.index],
-            "Quantidade": severity_counts.values,
-        }
+    chart_data = pd.Series(
+        severity_counts.to_numpy(),
+        index=pd.Index(
+            [SEVERITY_LEVELS.get(k, k) for k in severity_counts.index],
+            name="Gravidade",
+        ),
+        name="Quantidade",
     )
 
-    st.bar_chart(chart_data.set_index("Gravidade"))
+    st.bar_chart(chart_data)
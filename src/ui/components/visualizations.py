@@ -1,11 +1,9 @@
 """Visualization components for the Quake-Grade application."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import seaborn as sns
 import streamlit as st
 
 from ..utils.constants import (
@@ -18,6 +16,9 @@ from ..utils.constants import (
     HEADER_STATISTICS,
     HELP_STATISTICS,
     INFO_CORRELATION_REQUIREMENT,
+    MAP_AGGREGATION_DECIMALS,
+    MAP_AGGREGATION_THRESHOLD,
+    MAP_MARKER_SIZE_MAX,
     MAP_STYLE,
     MAP_TITLE,
     MAP_ZOOM_LEVEL,
@@ -28,8 +29,22 @@ from ..utils.constants import (
     WARNING_NO_NUMERIC_COLUMNS,
 )
 
-# Set the default style for matplotlib plots
-sns.set(style="whitegrid")
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+@st.cache_data
+def _describe_dataset(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute and cache the descriptive statistics of a dataset.
+
+    Args:
+        df: DataFrame to describe
+
+    Returns:
+        DataFrame with the statistics of every column
+    """
+    return df.describe(include="all")
 
 
 def display_statistics(df: pd.DataFrame):
@@ -44,6 +59,9 @@ def display_statistics(df: pd.DataFrame):
     # Use tabs for better organization
     tab1, tab2 = st.tabs([TAB_SUMMARY, TAB_DETAILED])
 
+    # One pass feeds both the summary metrics and the detailed table
+    description = _describe_dataset(df)
+
     with tab1:
         # Display key metrics using st.metric
         numeric_cols = df.select_dtypes(include="number").columns
@@ -54,18 +72,18 @@ def display_statistics(df: pd.DataFrame):
                 with cols[i]:
                     st.metric(
                         label=col,
-                        value=f"{df[col].mean():.2f}",
-                        delta=f"σ = {df[col].std():.2f}",
+                        value=f"{description.at['mean', col]:.2f}",
+                        delta=f"σ = {description.at['std', col]:.2f}",
                         help=HELP_STATISTICS,
                     )
 
     with tab2:
         # Display full statistics table
-        st.dataframe(df.describe(include="all"), use_container_width=True)
+        st.dataframe(description, use_container_width=True)
 
 
 @st.cache_data
-def create_histogram(df: pd.DataFrame, column: str) -> plt.Figure:
+def create_histogram(df: pd.DataFrame, column: str) -> "go.Figure":
     """
     Create a cached histogram for the specified column.
 
@@ -74,19 +92,23 @@ def create_histogram(df: pd.DataFrame, column: str) -> plt.Figure:
         column: Column name to plot
 
     Returns:
-        Matplotlib figure object
-    """
-    fig, ax = plt.subplots(figsize=(8, 6))
-    sns.histplot(data=df, x=column, kde=True, ax=ax)
-    ax.set_title(f"Distribuição de {column}")
-    ax.set_xlabel(column)
-    ax.set_ylabel("Frequência")
-    plt.tight_layout()
+        Plotly figure object
+    """
+    import plotly.express as px
+
+    # Binning and the violin density run in the browser, not in Python
+    fig = px.histogram(
+        df,
+        x=column,
+        marginal="violin",
+        title=f"Distribuição de {column}",
+    )
+    fig.update_layout(yaxis_title="Frequência")
     return fig
 
 
 @st.cache_data
-def create_boxplot(df: pd.DataFrame, column: str) -> plt.Figure:
+def create_boxplot(df: pd.DataFrame, column: str) -> "go.Figure":
     """
     Create a cached boxplot for the specified column.
 
@@ -95,14 +117,11 @@ def create_boxplot(df: pd.DataFrame, column: str) -> plt.Figure:
         column: Column name to plot
 
     Returns:
-        Matplotlib figure object
+        Plotly figure object
     """
-    fig, ax = plt.subplots(figsize=(8, 6))
-    sns.boxplot(data=df, x=column, ax=ax)
-    ax.set_title(f"Boxplot de {column}")
-    ax.set_xlabel(column)
-    plt.tight_layout()
-    return fig
+    import plotly.express as px
+
+    return px.box(df, x=column, title=f"Boxplot de {column}")
 
 
 def display_distribution_analysis(df: pd.DataFrame):
@@ -127,8 +146,8 @@ def display_distribution_analysis(df: pd.DataFrame):
         )
 
         if selected_hist:
-            fig = create_histogram(df, selected_hist)
-            st.pyplot(fig)
+            fig = create_histogram(df[[selected_hist]], selected_hist)
+            st.plotly_chart(fig, use_container_width=True)
 
     with col2:
         st.subheader(HEADER_BOXPLOTS)
@@ -137,18 +156,55 @@ def display_distribution_analysis(df: pd.DataFrame):
         )
 
         if selected_box:
-            fig = create_boxplot(df, selected_box)
-            st.pyplot(fig)
+            fig = create_boxplot(df[[selected_box]], selected_box)
+            st.plotly_chart(fig, use_container_width=True)
+
+
+def _aggregate_map_points(
+    df: pd.DataFrame, lat_col: str, lon_col: str, severity_col: str
+) -> pd.DataFrame:
+    """
+    Aggregate map points into cells of rounded coordinates.
+
+    Args:
+        df: DataFrame with location and severity data
+        lat_col: Latitude column name
+        lon_col: Longitude column name
+        severity_col: Severity column name
 
+    Returns:
+        DataFrame with one row per cell, its event count and modal severity
+    """
+    cell_cols = [lat_col, lon_col]
+    binned = df[[*cell_cols, severity_col]].assign(
+        **{col: df[col].round(MAP_AGGREGATION_DECIMALS) for col in cell_cols}
+    )
 
+    counts = (
+        binned.groupby([*cell_cols, severity_col], observed=True)
+        .size()
+        .reset_index(name="Quantidade")
+    )
+    # Ties on count resolve to the more severe class, since severities are an
+    # ordered Categorical, and the stable sort keeps that deterministic
+    modal = counts.sort_values(
+        ["Quantidade", severity_col], ascending=[False, False], kind="stable"
+    ).drop_duplicates(cell_cols)
+    totals = counts.groupby(cell_cols, as_index=False)["Quantidade"].sum()
+
+    return totals.merge(modal[[*cell_cols, severity_col]], on=cell_cols)
+
+
+@st.cache_data
 def create_severity_map(
     df: pd.DataFrame,
     lat_col: str = "Latitud",
     lon_col: str = "Longitud",
     severity_col: str = "Gravedad",
-) -> Optional[px.scatter_mapbox]:
+) -> Optional["go.Figure"]:
     """
-    Create an interactive map showing earthquake severity.
+    Create a cached interactive map showing earthquake severity.
+    Large datasets are aggregated by location to bound the rendered points.
 
     Args:
         df: DataFrame with location and severity data
@@ -163,11 +219,22 @@ def create_severity_map(
     if not required_cols.issubset(df.columns):
         return None
 
+    import plotly.express as px
+
     # Create hover data
     hover_data = {lat_col: ":.4f", lon_col: ":.4f"}
-
-    # Add magnitude if available
-    if "Magnitud" in df.columns:
+    size_col = None
+
+    if len(df) > MAP_AGGREGATION_THRESHOLD:
+        # Ship one marker per location cell, sized by its number of events on a
+        # log scale so single-event cells stay visible next to dense ones
+        df = _aggregate_map_points(df, lat_col, lon_col, severity_col)
+        df["Tamanho"] = np.log1p(df["Quantidade"])
+        hover_data["Quantidade"] = True
+        hover_data["Tamanho"] = False
+        size_col = "Tamanho"
+    elif "Magnitud" in df.columns:
+        # Add magnitude if available
         hover_data["Magnitud"] = ":.2f"
 
     fig = px.scatter_mapbox(
@@ -176,6 +243,8 @@ def create_severity_map(
         lon=lon_col,
         color=severity_col,
         color_discrete_map=SEVERITY_COLORS,
+        size=size_col,
+        size_max=MAP_MARKER_SIZE_MAX,
         zoom=MAP_ZOOM_LEVEL,
         mapbox_style=MAP_STYLE,
         hover_data=hover_data,
@@ -187,6 +256,36 @@ def create_severity_map(
     return fig
 
 
+@st.cache_data
+def create_correlation_heatmap(numeric_df: pd.DataFrame) -> "go.Figure":
+    """
+    Create a cached correlation heatmap for the numeric columns.
+
+    Args:
+        numeric_df: DataFrame with the numeric columns to correlate
+
+    Returns:
+        Plotly figure object
+    """
+    import plotly.express as px
+
+    # Calculate correlation matrix
+    corr_matrix = numeric_df.corr()
+
+    # Cell annotations are drawn by the browser in a single pass
+    fig = px.imshow(
+        corr_matrix,
+        text_auto=".2f",
+        aspect="auto",
+        color_continuous_scale="RdBu_r",
+        zmin=-1,
+        zmax=1,
+        title=CORRELATION_MATRIX_TITLE,
+    )
+    fig.update_layout(coloraxis_colorbar={"title": "Correlação"})
+    return fig
+
+
 def display_correlation_heatmap(df: pd.DataFrame):
     """
     Display correlation heatmap for numeric columns.
@@ -202,26 +301,8 @@ def display_correlation_heatmap(df: pd.DataFrame):
 
     st.subheader(HEADER_CORRELATION)
 
-    # Calculate correlation matrix
-    corr_matrix = numeric_df.corr()
-
-    # Create heatmap
-    fig, ax = plt.subplots(figsize=(10, 8))
-    sns.heatmap(
-        corr_matrix,
-        annot=True,
-        cmap="coolwarm",
-        center=0,
-        fmt=".2f",
-        square=True,
-        linewidths=0.5,
-        cbar_kws={"label": "Correlação"},
-        ax=ax,
-    )
-    ax.set_title(CORRELATION_MATRIX_TITLE)
-    plt.tight_layout()
-
-    st.pyplot(fig)
+    fig = create_correlation_heatmap(numeric_df)
+    st.plotly_chart(fig, use_container_width=True)
 
 
 def display_severity_map(predictions: pd.DataFrame):
@@ -233,7 +314,13 @@ def display_severity_map(predictions: pd.DataFrame):
     """
     st.subheader(HEADER_MAP)
 
-    map_fig = create_severity_map(predictions)
+    # Only pass the columns used by the map so the cache key stays small
+    map_columns = [
+        col
+        for col in ("Latitud", "Longitud", "Gravedad", "Magnitud")
+        if col in predictions.columns
+    ]
+    map_fig = create_severity_map(predictions[map_columns])
     if map_fig:
         st.plotly_chart(map_fig, use_container_width=True)
     else:
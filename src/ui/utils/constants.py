@@ -79,6 +79,12 @@ HELP_STATISTICS = "Média ± Desvio Padrão"
 LOADING_MODEL = "Carregando modelo de predição..."
 LOADING_PREDICTIONS = "Realizando predições..."
 
+# Predictions table configuration
+PREDICTIONS_STYLE_MAX_ROWS = 5_000  # Rows above which color styling is skipped
+PREDICTIONS_TABLE_HEIGHT = 500
+COLUMN_SEVERITY_LABEL = "Gravidade"
+HELP_SEVERITY_COLUMN = "Gravidade prevista pelo modelo"
+
 # Download configuration
 DOWNLOAD_FILENAME = "predicoes_terremotos.csv"
 
@@ -95,9 +101,11 @@ CORRELATION_MATRIX_TITLE = "Matriz de Correlação"
 # Data source text
 SOURCE_UPLOAD_TEXT = "📂 Dados carregados do arquivo"
 SOURCE_RANDOM_TEXT = "🔄 Dados randômicos gerados"
+SOURCE_TEXTS = {"upload": SOURCE_UPLOAD_TEXT, "random": SOURCE_RANDOM_TEXT}
 
 # Column names (internal use in English, display in Portuguese)
 EXPECTED_COLUMNS = ["Magnitud", "Latitud", "Longitud", "Profundidad"]
+EXPECTED_DTYPES = dict.fromkeys(EXPECTED_COLUMNS, "float32")
 
 # Severity levels and colors
 SEVERITY_LEVELS = {
@@ -120,10 +128,20 @@ BASE_DATASET_PATH = "src/modelling/dataset/df_test.csv"
 
 # Cache configuration
 CACHE_TTL_DATA = 3600  # 1 hour
+CACHE_MAX_ENTRIES = 10  # Cached results kept per function for large outputs
+
+# Prediction configuration
+PREDICTION_BATCH_SIZE = 10_000  # Rows scored per predict_model call
+
+# Upload configuration
+UPLOAD_CHUNK_SIZE = 100_000  # Rows read per chunk from uploaded CSV files
 
 # Map configuration
 MAP_ZOOM_LEVEL = 4
 MAP_STYLE = "carto-positron"
+MAP_AGGREGATION_THRESHOLD = 20_000  # Points above which the map is aggregated
+MAP_AGGREGATION_DECIMALS = 2  # Coordinate rounding used for aggregation cells
+MAP_MARKER_SIZE_MAX = 20  # Largest marker diameter (px) for aggregated cells
 
 # Menu configuration
 MENU_ABOUT = """
@@ -140,12 +158,14 @@ AI_ANALYSIS_TITLE = "🤖 Análise com LLM"
 AI_ANALYSIS_DESCRIPTION = (
     "Clique nos botões abaixo para gerar análises específicas usando um LLM."
 )
+AI_ALL_BUTTON = "✨ Gerar Todas as Análises"
 AI_INSIGHTS_BUTTON = "💡 Gerar Insights"
 AI_RISK_BUTTON = "⚠️ Avaliar Riscos"
 AI_QUALITY_BUTTON = "📊 Analisar Qualidade"
 AI_CLEAR_BUTTON = "🗑️ Limpar Todas as Análises"
 
 # AI Analysis Spinner Messages
+AI_ALL_SPINNER = "Gerando todas as análises..."
 AI_INSIGHTS_SPINNER = "Gerando insights..."
 AI_RISK_SPINNER = "Analisando riscos..."
 AI_QUALITY_SPINNER = "Analisando qualidade dos dados..."
@@ -168,6 +188,7 @@ AI_PREDICTIONS_REQUIRED = (
 )
 
 # AI Analysis Error Messages
+AI_ALL_UNKNOWN_ERROR = "Erro desconhecido ao gerar as análises"
 AI_INSIGHTS_UNKNOWN_ERROR = "Erro desconhecido ao gerar insights"
 AI_RISK_UNKNOWN_ERROR = "Erro desconhecido ao avaliar riscos"
 AI_QUALITY_UNKNOWN_ERROR = "Erro desconhecido ao analisar qualidade"
@@ -1,18 +1,33 @@
 """Helper utilities for the Quake-Grade application."""
 
+import hashlib
+import threading
+import weakref
+
+import pandas as pd
 import streamlit as st
 
+try:
+    import xxhash
+except ImportError:  # xxhash is optional, installed transitively with PyCaret
+    xxhash = None
+
 from ..utils.constants import (
     APP_ICON,
     APP_NAME,
     GITHUB_REPO_URL,
     MENU_ABOUT,
-    SOURCE_RANDOM_TEXT,
-    SOURCE_UPLOAD_TEXT,
+    SOURCE_TEXTS,
     SUBTITLE,
     TITLE,
 )
 
+# Dataset hashes memoized by DataFrame id; weak references guard against id reuse
+_DATA_HASH_CACHE: dict[int, tuple[weakref.ref, tuple, str]] = {}
+_DATA_HASH_CACHE_SIZE = 8
+# Session threads share the memo, so lookups and evictions are serialized
+_DATA_HASH_LOCK = threading.Lock()
+
 
 def initialize_session_state():
     """Initialize session state variables."""
@@ -54,8 +69,7 @@ def display_header():
 def display_data_source_info():
     """Display information about the current data source."""
     if st.session_state.data_source:
-        source_text = {"upload": SOURCE_UPLOAD_TEXT, "random": SOURCE_RANDOM_TEXT}
-        st.caption(source_text.get(st.session_state.data_source, ""))
+        st.caption(SOURCE_TEXTS.get(st.session_state.data_source, ""))
 
 
 def clear_data_state():
@@ -64,3 +78,53 @@ def clear_data_state():
     st.session_state.upload_valid = True
     st.session_state.missing_columns = []
     st.session_state.data_source = None
+
+
+def generate_data_hash(df: pd.DataFrame) -> str:
+    """
+    Generate a content hash of a dataset, memoized by DataFrame identity.
+
+    Args:
+        df: DataFrame to hash
+
+    Returns:
+        Hex digest identifying the DataFrame content
+    """
+    # Session state keeps the same DataFrame object across reruns
+    with _DATA_HASH_LOCK:
+        cached = _DATA_HASH_CACHE.get(id(df))
+    if cached is not None:
+        df_ref, shape, data_hash = cached
+        if df_ref() is df and shape == df.shape:
+            return data_hash
+
+    # Hash outside the lock so sessions never wait on each other's DataFrames
+    data_hash = _compute_data_hash(df)
+
+    with _DATA_HASH_LOCK:
+        if len(_DATA_HASH_CACHE) >= _DATA_HASH_CACHE_SIZE:
+            _DATA_HASH_CACHE.pop(next(iter(_DATA_HASH_CACHE)), None)
+        _DATA_HASH_CACHE[id(df)] = (weakref.ref(df), df.shape, data_hash)
+    return data_hash
+
+
+def _compute_data_hash(df: pd.DataFrame) -> str:
+    """
+    Compute a content hash of a dataset for caching purposes.
+
+    Args:
+        df: DataFrame to hash
+
+    Returns:
+        Hex digest of the column names, dtypes and values
+    """
+    # Hash the raw column values in C instead of formatting every cell as text;
+    # XXH3 is preferred when available, BLAKE2b is the stdlib fallback
+    if xxhash is not None:
+        digest = xxhash.xxh3_128()
+    else:
+        digest = hashlib.blake2b(digest_size=16, usedforsecurity=False)
+    digest.update(str(tuple(df.columns)).encode())
+    digest.update(str(tuple(df.dtypes.astype(str))).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()